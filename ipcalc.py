@@ -16,9 +16,14 @@
 # GNU General Public License for more details.
 
 import argparse
+import bisect
+import functools
+import io
 import ipaddress
+import itertools
+import socket
 import sys
-import math
+import types
 
 VERSION = '0.51 (Python Conversion)'
 
@@ -32,13 +37,14 @@ class Colors:
     MAGENTA = "\033[35m"
     GREEN = "\033[32m"
     ERROR = "\033[31m"
-    
+
+    _ATTRS = ('BLUE', 'NORMAL', 'YELLOW', 'RED', 'MAGENTA', 'GREEN', 'ERROR')
+
     @staticmethod
     def disable():
         """Disables all color output."""
-        for attr in dir(Colors):
-            if isinstance(getattr(Colors, attr), str) and getattr(Colors, attr).startswith("\033"):
-                setattr(Colors, attr, "")
+        for attr in Colors._ATTRS:
+            setattr(Colors, attr, "")
 
 # --- HTML Definitions ---
 class Html:
@@ -51,35 +57,66 @@ class Html:
     GREEN = '<font color="#663366">'  # Subnet bits
     FONT_END = '</font>'
     BREAK = "<br>"
-    
+
+    _ATTRS = ('BLUE', 'NORMAL', 'YELLOW', 'RED', 'MAGENTA', 'GREEN', 'FONT_END', 'BREAK')
+
     @staticmethod
     def disable():
         """Disables HTML output by emptying tags."""
-        for attr in dir(Html):
-            if isinstance(getattr(Html, attr), str) and getattr(Html, attr).startswith("<"):
-                setattr(Html, attr, "")
+        for attr in Html._ATTRS:
+            setattr(Html, attr, "")
 
 # --- Global State (for formatting) ---
 _COLOR_MODE = 'text' # 'text', 'color', 'html'
-_CURRENT_COLOR = ''
 
-def set_color(new_color_code):
+# Mode-derived constants, rebound once by _specialize_printers() after
+# option parsing. Defaults match _COLOR_MODE = 'text'.
+_IS_HTML = False
+_COLORIZE = False
+_PALETTE = Colors
+
+def _palette_namespace(palette):
+    """Snapshots the palette's codes by role into a SimpleNamespace."""
+    return types.SimpleNamespace(
+        normal=palette.NORMAL,
+        blue=palette.BLUE,
+        binary=palette.YELLOW,
+        mask=palette.RED,
+        cls=palette.MAGENTA,
+        subnet=palette.GREEN,
+        font_end=getattr(palette, 'FONT_END', ''),
+    )
+
+_C = _palette_namespace(Colors)
+
+def _specialize_printers(color_mode, show_binary=True):
     """
-    Sets the current output color, avoiding redundant ANSI/HTML tags.
-    This mimics the behavior of the original Perl script's set_color sub.
+    Binds the mode-derived printing constants for the chosen output mode
+    and selects the matching print_line variant. Mode and --nobinary are
+    fixed once the options are parsed, so the printers read these
+    constants instead of re-testing _COLOR_MODE (or a show_binary flag)
+    on every call.
     """
-    global _CURRENT_COLOR
-    if new_color_code == _CURRENT_COLOR:
-        return ""
-    
-    output = ""
-    # In HTML mode, we need to close the previous font tag
-    if _COLOR_MODE == 'html' and _CURRENT_COLOR != "":
-        output += Html.FONT_END
-
-    _CURRENT_COLOR = new_color_code
-    output += new_color_code
-    return output
+    global _IS_HTML, _COLORIZE, _PALETTE, _C, print_line, print_network_info
+    _IS_HTML = color_mode == 'html'
+    _COLORIZE = color_mode in ('color', 'html')
+    _PALETTE = Html if _IS_HTML else Colors
+    _C = _palette_namespace(_PALETTE)
+    print_line = _PRINT_LINE_VARIANTS[(color_mode, show_binary)]
+    print_network_info = _print_network_info_html if _IS_HTML else _print_network_info_plain
+
+def _fast_v4(addr_str: str):
+    """
+    Parses a dotted-quad IPv4 address through the C-level socket parser,
+    which is much faster than ipaddress.ip_address's string validation.
+    Returns None if addr_str is not a strict dotted quad (e.g. IPv6), so
+    callers can fall back to the generic parser.
+    """
+    try:
+        packed = socket.inet_pton(socket.AF_INET, addr_str)
+    except OSError:
+        return None
+    return ipaddress.IPv4Address(int.from_bytes(packed, 'big'))
 
 def get_class(address: ipaddress.IPv4Address):
     """Determines the class (A, B, C, D, E) of an IPv4 address."""
@@ -94,210 +131,389 @@ def get_class(address: ipaddress.IPv4Address):
         return 'D'
     return 'E'
 
+# Well-known netblocks, parsed once at import as (first, last, desc, url)
+# integer ranges. The blocks are disjoint, so they are kept sorted by first
+# address and looked up with bisect.
+_NETBLOCKS = sorted(
+    (int(block.network_address), int(block.broadcast_address), desc, url)
+    for block, desc, url in (
+        (ipaddress.ip_network(block_str), desc, url)
+        for block_str, (desc, url) in {
+            "10.0.0.0/8": ("Private Internet", "http://www.ietf.org/rfc/rfc1918.txt"),
+            "172.16.0.0/12": ("Private Internet", "http://www.ietf.org/rfc/rfc1918.txt"),
+            "192.168.0.0/16": ("Private Internet", "http://www.ietf.org/rfc/rfc1918.txt"),
+            "127.0.0.0/8": ("Loopback", "http://www.ietf.org/rfc/rfc1700.txt"),
+            "169.254.0.0/16": ("APIPA", "http://www.ietf.org/rfc/rfc3330.txt"),
+            "224.0.0.0/4": ("Multicast", "http://www.ietf.org/rfc/rfc3171.txt"),
+        }.items()
+    )
+)
+_NETBLOCK_STARTS = [block[0] for block in _NETBLOCKS]
+
 def get_netblock_description(network: ipaddress.IPv4Network):
     """Returns a description for well-known netblocks (e.g., private ranges)."""
-    descriptions = {
-        "10.0.0.0/8": ("Private Internet", "http://www.ietf.org/rfc/rfc1918.txt"),
-        "172.16.0.0/12": ("Private Internet", "http://www.ietf.org/rfc/rfc1918.txt"),
-        "192.168.0.0/16": ("Private Internet", "http://www.ietf.org/rfc/rfc1918.txt"),
-        "127.0.0.0/8": ("Loopback", "http://www.ietf.org/rfc/rfc1700.txt"),
-        "169.254.0.0/16": ("APIPA", "http://www.ietf.org/rfc/rfc3330.txt"),
-        "224.0.0.0/4": ("Multicast", "http://www.ietf.org/rfc/rfc3171.txt"),
-    }
-    for block_str, (desc, url) in descriptions.items():
-        block = ipaddress.ip_network(block_str)
-        if network.overlaps(block):
-            if network.subnet_of(block):
+    first = int(network.network_address)
+    last = int(network.broadcast_address)
+
+    # Rightmost block starting at or below the network's first address.
+    idx = bisect.bisect_right(_NETBLOCK_STARTS, first) - 1
+    if idx >= 0:
+        block_first, block_last, desc, url = _NETBLOCKS[idx]
+        if first <= block_last:
+            if last <= block_last:
                 return (desc, url)
             return (f"Partially overlaps with {desc}", url)
+
+    # The network starts outside every block but may still reach into the
+    # next one above it.
+    if idx + 1 < len(_NETBLOCKS) and last >= _NETBLOCK_STARTS[idx + 1]:
+        return (f"Partially overlaps with {_NETBLOCKS[idx + 1][2]}", _NETBLOCKS[idx + 1][3])
     return (None, None)
 
-def print_line(label, addr, network, old_network=None, show_class_bits=False, show_binary=True):
-    """Prints a formatted line of IP information."""
-    
-    is_netmask = label.lower() == 'netmask'
-    
-    addr_str = str(addr)
-    if is_netmask and isinstance(addr, ipaddress.IPv4Address):
-        addr_str += f" = {network.prefixlen}"
-    if label.lower() == 'network':
-        addr_str += f"/{network.prefixlen}"
+# Byte value -> 8-char binary string, so an address's bit string is built
+# from per-byte table lookups instead of the generic int-formatting path.
+_BITS = [format(b, '08b') for b in range(256)]
 
-    if _COLOR_MODE == 'html':
-        print('<tr>')
-        print(f'  <td><tt>{set_color(Html.NORMAL)}{label+":":<11s}{Html.FONT_END}</tt></td>')
-        print(f'  <td><tt>{set_color(Html.BLUE)}{addr_str:<21s}{Html.FONT_END}</tt></td>')
-    else:
-        print(f"{set_color(Colors.NORMAL)}{label+':':<11s} {set_color(Colors.BLUE)}{addr_str:<21s}", end="")
+@functools.lru_cache(maxsize=33)
+def _netmask_int(prefixlen: int) -> int:
+    """Netmask for an IPv4 prefix length, as a 32-bit integer. There are
+    only 33 possible prefix lengths, so the cache serves every repeat in
+    O(1); the wildcard is the xor with 0xFFFFFFFF."""
+    return (0xFFFFFFFF << (32 - prefixlen)) & 0xFFFFFFFF
 
-    if show_binary:
-        binary_str = f"{int(addr):032b}"
-        
-        # Colorize binary output
-        bits_out = []
-        if _COLOR_MODE in ['color', 'html']:
-            color_map = {
-                'text': Colors,
-                'color': Colors,
-                'html': Html
-            }[_COLOR_MODE]
-
-            c_normal = color_map.NORMAL
-            c_binary = color_map.YELLOW
-            c_mask = color_map.RED
-            c_class = color_map.MAGENTA
-            c_subnet = color_map.GREEN
-            
-            # Default color
-            current_color = c_mask if is_netmask else c_binary
-            if show_class_bits:
-                current_color = c_class
-            
-            bits_out.append(set_color(current_color))
-
-            for i, bit in enumerate(binary_str):
-                # Class bit coloring (for network address)
-                if show_class_bits and i > 0 and binary_str[i-1] == '1' and bit == '0':
-                    show_class_bits = False
-                    bits_out.append(set_color(c_binary))
-
-                # Delineate netmask sections
-                if i == network.prefixlen or (old_network and i == old_network.prefixlen):
-                     bits_out.append(" ")
-                     if not is_netmask:
-                         if i == network.prefixlen and old_network and network.prefixlen > old_network.prefixlen:
-                             bits_out.append(set_color(c_subnet))
-                         elif old_network and i == old_network.prefixlen:
-                             bits_out.append(set_color(c_binary))
-                
-                bits_out.append(bit)
-                
-                if (i + 1) % 8 == 0 and i < 31:
-                    bits_out.append(f"{set_color(c_normal)}.{set_color(current_color)}")
-
-            bits_out.append(set_color(c_normal))
-        else:
-            bits_out.append(binary_str[:network.prefixlen])
-            bits_out.append(" ")
-            bits_out.append(binary_str[network.prefixlen:])
+def _v4_str(value: int) -> str:
+    """Formats a 32-bit integer as a dotted quad without building an IPv4Address."""
+    return "%d.%d.%d.%d" % (value >> 24 & 0xFF, value >> 16 & 0xFF, value >> 8 & 0xFF, value & 0xFF)
 
-        if _COLOR_MODE == 'html':
-             print(f'  <td><tt>{"".join(bits_out)}</tt></td>')
-        else:
-             print(f' {"".join(bits_out)}')
-    
-    if _COLOR_MODE == 'html':
-        print('</tr>')
+@functools.lru_cache(maxsize=None)
+def _build_binary_template(prefixlen, old_prefixlen, is_netmask, show_class_bits, class_boundary, color_mode):
+    """
+    Builds a cached format template for the colored 32-bit binary field.
+
+    The template contains all color escapes and '.' separators at fixed
+    positions, with '%s' slots for the runs of bits between them, so
+    rendering a line is a single %-format of a handful of string slices
+    instead of a 32-iteration Python loop. Returns (template, spans) where
+    spans are the (start, end) slices of the 32-char bit string that fill
+    the slots. The only data-dependent part of the coloring is where the
+    class bits end (the first '1'->'0' transition), which the caller passes
+    as class_boundary.
+    """
+    color_map = Html if color_mode == 'html' else Colors
+
+    c_normal = color_map.NORMAL
+    c_binary = color_map.YELLOW
+    c_mask = color_map.RED
+    c_class = color_map.MAGENTA
+    c_subnet = color_map.GREEN
+
+    out = []
+    spans = []
+    dot_seps = {}
+    run_start = None
+    # Templates are self-contained: they open their own first color and,
+    # in HTML mode, close their last tag, so no caller state is assumed.
+    current = ""
+
+    def literal(text):
+        # Appends fixed text, first closing any open run of bit slots.
+        nonlocal run_start
+        if run_start is not None:
+            out.append("%s")
+            spans.append((run_start, run_end))
+            run_start = None
+        out.append(text)
+
+    def emit(new_color):
+        # Skips redundant color changes and, in HTML mode, closes the
+        # previous font tag first.
+        nonlocal current
+        if new_color == current:
+            return
+        if color_mode == 'html' and current != "":
+            literal(Html.FONT_END)
+        current = new_color
+        literal(new_color)
+
+    default_color = c_mask if is_netmask else c_binary
+    if show_class_bits:
+        default_color = c_class
+    emit(default_color)
+
+    for i in range(32):
+        if class_boundary is not None and i == class_boundary:
+            emit(c_binary)
+
+        if i == prefixlen or (old_prefixlen is not None and i == old_prefixlen):
+            literal(" ")
+            if not is_netmask:
+                if i == prefixlen and old_prefixlen is not None and prefixlen > old_prefixlen:
+                    emit(c_subnet)
+                elif old_prefixlen is not None and i == old_prefixlen:
+                    emit(c_binary)
+
+        if run_start is None:
+            run_start = i
+        run_end = i + 1
+
+        if (i + 1) % 8 == 0 and i < 31:
+            # The byte separator is always "switch to normal, dot, restore
+            # the default color"; fold the whole transition into one
+            # precomputed constant per from-color instead of two emit()s.
+            sep = dot_seps.get(current)
+            if sep is None:
+                sep = ""
+                if current != c_normal:
+                    if color_mode == 'html' and current != "":
+                        sep += Html.FONT_END
+                    sep += c_normal
+                sep += "."
+                if default_color != c_normal:
+                    if color_mode == 'html':
+                        sep += Html.FONT_END
+                    sep += default_color
+                dot_seps[current] = sep
+            literal(sep)
+            current = default_color
+
+    if color_mode == 'html':
+        literal(Html.FONT_END)
     else:
-        # if not showing binary, we still need a newline
-        if not show_binary:
-            print()
+        emit(c_normal)
+    literal("")
+    return "".join(out), tuple(spans)
 
-def print_network_info(network: ipaddress.IPv4Network, old_network=None, show_binary=True):
-    """Prints the full details for a given network."""
-    if _COLOR_MODE == 'html':
-        print('<table border="0" cellspacing="0" cellpadding="0">')
+@functools.lru_cache(maxsize=1024)
+def _render_binary(binary_str, prefixlen, old_prefixlen, is_netmask, show_class_bits, color_mode):
+    """
+    Renders a 32-char bit string as the finished (possibly colored) binary
+    field. Cached on the full argument tuple: in a subnet enumeration every
+    netmask and wildcard line repeats identically, so all but the first
+    render are dictionary hits.
+    """
+    if color_mode in ('color', 'html'):
+        # Class bit coloring stops at the first '1' -> '0' transition
+        # (for the network address line).
+        class_boundary = None
+        if show_class_bits:
+            transition = binary_str.find('10')
+            if transition != -1:
+                class_boundary = transition + 1
 
-    print_line("Network", network.network_address, network, old_network, show_class_bits=True, show_binary=show_binary)
-    if network.prefixlen < 31:
-        print_line("HostMin", network.network_address + 1, network, old_network, show_binary=show_binary)
-        print_line("HostMax", network.broadcast_address - 1, network, old_network, show_binary=show_binary)
-        print_line("Broadcast", network.broadcast_address, network, old_network, show_binary=show_binary)
-    elif network.prefixlen == 31: # Point-to-Point
-        print_line("HostMin", network.network_address, network, old_network, show_binary=show_binary)
-        print_line("HostMax", network.broadcast_address, network, old_network, show_binary=show_binary)
-    
+        template, spans = _build_binary_template(
+            prefixlen, old_prefixlen, is_netmask, show_class_bits,
+            class_boundary, color_mode)
+        return template % tuple(binary_str[start:end] for start, end in spans)
+
+    return f"{binary_str[:prefixlen]} {binary_str[prefixlen:]}"
+
+
+def _line_addr_str(label, addr, network):
+    """
+    Builds the address column text for a line. addr may be an address
+    object or a bare 32-bit integer (the netmask/wildcard fast path, which
+    avoids allocating an IPv4Address just to print it).
+    """
+    is_netmask = label.lower() == 'netmask'
+    if isinstance(addr, int):
+        addr_str = _v4_str(addr)
+        is_v4 = True
+    else:
+        addr_str = str(addr)
+        is_v4 = isinstance(addr, ipaddress.IPv4Address)
+    if is_netmask and is_v4:
+        addr_str += f" = {network.prefixlen}"
+    if label.lower() == 'network':
+        addr_str += f"/{network.prefixlen}"
+    return is_netmask, addr_str
+
+def _line_binary_str(addr):
+    """Builds the 32-char bit string for an address object or bare int."""
+    if isinstance(addr, int):
+        return _BITS[addr >> 24 & 0xFF] + _BITS[addr >> 16 & 0xFF] + _BITS[addr >> 8 & 0xFF] + _BITS[addr & 0xFF]
+    packed = addr.packed
+    return _BITS[packed[0]] + _BITS[packed[1]] + _BITS[packed[2]] + _BITS[packed[3]]
+
+# --- print_line variants ---
+# One small function per (output mode, binary) combination, so the hot
+# path carries no mode branches; _specialize_printers binds the right one
+# to print_line once the options are parsed.
+
+def _print_line_text(label, addr, network, old_network=None, show_class_bits=False):
+    """Prints a line of IP information, plain text with binary field."""
+    is_netmask, addr_str = _line_addr_str(label, addr, network)
+    bits_str = _render_binary(
+        _line_binary_str(addr), network.prefixlen,
+        old_network.prefixlen if old_network else None,
+        is_netmask, show_class_bits, 'text')
+    sys.stdout.write(f"{label+':':<11s} {addr_str:<21s} {bits_str}\n")
+
+def _print_line_color(label, addr, network, old_network=None, show_class_bits=False):
+    """Prints a line of IP information, ANSI color with binary field."""
+    is_netmask, addr_str = _line_addr_str(label, addr, network)
+    bits_str = _render_binary(
+        _line_binary_str(addr), network.prefixlen,
+        old_network.prefixlen if old_network else None,
+        is_netmask, show_class_bits, 'color')
+    sys.stdout.write(f"{_C.normal}{label+':':<11s} {_C.blue}{addr_str:<21s} {bits_str}\n")
+
+def _print_line_html(label, addr, network, old_network=None, show_class_bits=False):
+    """Prints a line of IP information as an HTML table row with binary field."""
+    is_netmask, addr_str = _line_addr_str(label, addr, network)
+    bits_str = _render_binary(
+        _line_binary_str(addr), network.prefixlen,
+        old_network.prefixlen if old_network else None,
+        is_netmask, show_class_bits, 'html')
+    sys.stdout.write('<tr>\n'
+                     f'  <td><tt>{_C.normal}{label+":":<11s}{_C.font_end}</tt></td>\n'
+                     f'  <td><tt>{_C.blue}{addr_str:<21s}{_C.font_end}</tt></td>\n'
+                     f'  <td><tt>{bits_str}</tt></td>\n</tr>\n')
+
+def _print_line_text_nobinary(label, addr, network, old_network=None, show_class_bits=False):
+    """Prints a line of IP information, plain text without binary field."""
+    _, addr_str = _line_addr_str(label, addr, network)
+    sys.stdout.write(f"{label+':':<11s} {addr_str:<21s}\n")
+
+def _print_line_color_nobinary(label, addr, network, old_network=None, show_class_bits=False):
+    """Prints a line of IP information, ANSI color without binary field."""
+    _, addr_str = _line_addr_str(label, addr, network)
+    sys.stdout.write(f"{_C.normal}{label+':':<11s} {_C.blue}{addr_str:<21s}\n")
+
+def _print_line_html_nobinary(label, addr, network, old_network=None, show_class_bits=False):
+    """Prints a line of IP information as an HTML table row without binary field."""
+    _, addr_str = _line_addr_str(label, addr, network)
+    sys.stdout.write('<tr>\n'
+                     f'  <td><tt>{_C.normal}{label+":":<11s}{_C.font_end}</tt></td>\n'
+                     f'  <td><tt>{_C.blue}{addr_str:<21s}{_C.font_end}</tt></td>\n'
+                     '</tr>\n')
+
+_PRINT_LINE_VARIANTS = {
+    ('text', True): _print_line_text,
+    ('color', True): _print_line_color,
+    ('html', True): _print_line_html,
+    ('text', False): _print_line_text_nobinary,
+    ('color', False): _print_line_color_nobinary,
+    ('html', False): _print_line_html_nobinary,
+}
+
+# Rebound by _specialize_printers() once the options are parsed.
+print_line = _print_line_text
+
+def _hosts_count(network):
+    """Number of usable host addresses in a network."""
     hosts_count = network.num_addresses
     if network.prefixlen < 31:
         hosts_count -= 2
     if hosts_count < 0:
         hosts_count = 0
+    return hosts_count
 
-    if _COLOR_MODE == 'html':
-        print('<tr>')
-        print(f'  <td><tt>{set_color(Html.NORMAL)}Hosts/Net:{Html.FONT_END}</tt></td>')
-        print(f'  <td colspan="2"><tt>{set_color(Html.BLUE)}{hosts_count}{Html.FONT_END}</tt></td>')
-        print('</tr>')
-    else:
-        print(f"{set_color(Colors.NORMAL)}Hosts/Net:  {set_color(Colors.BLUE)}{hosts_count}")
+def _print_host_lines(network, old_network):
+    """Prints the Network/HostMin/HostMax/Broadcast lines for a network."""
+    print_line("Network", network.network_address, network, old_network, show_class_bits=True)
+    if network.prefixlen < 31:
+        print_line("HostMin", network.network_address + 1, network, old_network)
+        print_line("HostMax", network.broadcast_address - 1, network, old_network)
+        print_line("Broadcast", network.broadcast_address, network, old_network)
+    elif network.prefixlen == 31: # Point-to-Point
+        print_line("HostMin", network.network_address, network, old_network)
+        print_line("HostMax", network.broadcast_address, network, old_network)
+
+def _print_network_info_plain(network: ipaddress.IPv4Network, old_network=None):
+    """Prints the full details for a given network (text/color modes)."""
+    _print_host_lines(network, old_network)
+
+    print(f"{_C.normal}Hosts/Net:  {_C.blue}{_hosts_count(network)}")
 
     # Class and Netblock Info
     desc, url = get_netblock_description(network)
     class_info = get_class(network.network_address)
     info_parts = []
-    
-    if _COLOR_MODE in ['color', 'html']:
-        color_map = {'color': Colors, 'html': Html}[_COLOR_MODE]
-        info_parts.append(f"{set_color(color_map.MAGENTA)}Class {class_info}{set_color(color_map.NORMAL)}")
-        if network.prefixlen == 31:
-            info_parts.append("PtP Link RFC 3021")
-        if desc:
-            if _COLOR_MODE == 'html':
-                 info_parts.append(f'<a href="{url}">{desc}</a>')
-            else:
-                 info_parts.append(desc)
+
+    if _COLORIZE:
+        info_parts.append(f"{_C.cls}Class {class_info}{_C.normal}")
     else:
         info_parts.append(f"Class {class_info}")
-        if network.prefixlen == 31:
-            info_parts.append("PtP Link RFC 3021")
-        if desc:
-            info_parts.append(desc)
-
-    info_str = ", ".join(info_parts)
-    if _COLOR_MODE == 'html':
-        print('<tr>')
-        print(f'<td colspan="3">{set_color(Html.NORMAL)}{info_str}{Html.FONT_END}</td>')
-        print('</tr></table>')
-        print('<br>')
-    else:
-        print(info_str)
-        print(set_color(Colors.NORMAL))
+    if network.prefixlen == 31:
+        info_parts.append("PtP Link RFC 3021")
+    if desc:
+        info_parts.append(desc)
+
+    print(", ".join(info_parts))
+    print(_C.normal)
+
+def _print_network_info_html(network: ipaddress.IPv4Network, old_network=None):
+    """Prints the full details for a given network as an HTML table."""
+    print('<table border="0" cellspacing="0" cellpadding="0">')
 
+    _print_host_lines(network, old_network)
+
+    print('<tr>')
+    print(f'  <td><tt>{_C.normal}Hosts/Net:{_C.font_end}</tt></td>')
+    print(f'  <td colspan="2"><tt>{_C.blue}{_hosts_count(network)}{_C.font_end}</tt></td>')
+    print('</tr>')
+
+    # Class and Netblock Info
+    desc, url = get_netblock_description(network)
+    class_info = get_class(network.network_address)
+    info_parts = [f"{_C.cls}Class {class_info}{_C.font_end}"]
+    if network.prefixlen == 31:
+        info_parts.append("PtP Link RFC 3021")
+    if desc:
+        info_parts.append(f'<a href="{url}">{desc}</a>')
+
+    print('<tr>')
+    print(f'<td colspan="3">{_C.normal}{", ".join(info_parts)}{_C.font_end}</td>')
+    print('</tr></table>')
+    print('<br>')
+
+# Rebound by _specialize_printers() once the options are parsed.
+print_network_info = _print_network_info_plain
+
+
+@functools.lru_cache(maxsize=None)
+def _format_v6_binary(packed: bytes):
+    """Renders 16 packed bytes as colon-separated 16-bit binary groups."""
+    return ":".join(_BITS[packed[i]] + _BITS[packed[i + 1]] for i in range(0, 16, 2))
 
 def format_ipv6_binary(address: ipaddress.IPv6Address):
     """Formats an IPv6 address into its binary representation with colons."""
-    binary_str = f"{int(address):0128b}"
-    parts = [binary_str[i:i+16] for i in range(0, 128, 16)]
-    return ":".join(parts)
+    return _format_v6_binary(address.packed)
 
 def handle_ipv6_calculation(network: ipaddress.IPv6Network, address: ipaddress.IPv6Address, show_binary=True):
     """Prints the details for a given IPv6 network, mimicking the original Perl script."""
-    # Select the correct color palette based on the mode
-    if _COLOR_MODE == 'html':
-        C = Html
-    else:
-        C = Colors
-
     # Address line
-    line = (f"{set_color(C.NORMAL)}{'Address:':<9s}"
-          f"{set_color(C.BLUE)}{str(address):<40s}")
+    line = (f"{_C.normal}{'Address:':<9s}{_C.font_end}"
+          f"{_C.blue}{str(address):<40s}{_C.font_end}")
     if show_binary:
-          line += f"{set_color(C.YELLOW)}{format_ipv6_binary(address)}"
+          line += f"{_C.binary}{format_ipv6_binary(address)}{_C.font_end}"
     print(line)
-    
+
     # Netmask line
-    line = (f"{set_color(C.NORMAL)}{'Netmask:':<9s}"
-            f"{set_color(C.BLUE)}{network.prefixlen:<40d}")
+    line = (f"{_C.normal}{'Netmask:':<9s}{_C.font_end}"
+            f"{_C.blue}{network.prefixlen:<40d}{_C.font_end}")
     if show_binary:
-        netmask_binary = f"{int(network.netmask):0128b}"
-        netmask_bin_formatted = ":".join([netmask_binary[i:i+16] for i in range(0, 128, 16)])
-        line += f"{set_color(C.RED)}{netmask_bin_formatted}" # Using RED for consistency
+        line += f"{_C.mask}{format_ipv6_binary(network.netmask)}{_C.font_end}" # Using RED for consistency
     print(line)
 
     # Prefix line
-    line = (f"{set_color(C.NORMAL)}{'Prefix:':<9s}"
-            f"{set_color(C.BLUE)}{str(network):<40s}")
+    line = (f"{_C.normal}{'Prefix:':<9s}{_C.font_end}"
+            f"{_C.blue}{str(network):<40s}{_C.font_end}")
     if show_binary:
-        line += f"{set_color(C.YELLOW)}{format_ipv6_binary(network.network_address)}"
+        line += f"{_C.binary}{format_ipv6_binary(network.network_address)}{_C.font_end}"
     print(line)
-    
+
     # Reset color at the end
-    print(set_color(C.NORMAL))
+    print(Colors.NORMAL if not _IS_HTML else '')
 
 
+def _ceil_log2(n: int) -> int:
+    """Returns the smallest p such that 2**p >= n, using integer bit math."""
+    return (n - 1).bit_length()
+
 def handle_split_network(network: ipaddress.IPv4Network, sizes: list):
     """Handles network splitting (VLSM)."""
-    
+
     # Calculate required block size for each host count
     # Size must be a power of 2, and accommodate network/broadcast addresses
     needed_blocks = []
@@ -305,8 +521,7 @@ def handle_split_network(network: ipaddress.IPv4Network, sizes: list):
         # We need size + 2 addresses (network + broadcast)
         actual_size = size + 2
         # Find the next power of 2
-        power = math.ceil(math.log2(actual_size))
-        block_size = 2**power
+        block_size = 1 << _ceil_log2(actual_size)
         needed_blocks.append({'original_size': size, 'block_size': block_size, 'original_index': i})
 
     # Sort by largest block size first to allocate contiguously
@@ -314,15 +529,15 @@ def handle_split_network(network: ipaddress.IPv4Network, sizes: list):
 
     total_needed = sum(b['block_size'] for b in needed_blocks)
     if total_needed > network.num_addresses:
-        print(f"{set_color(Colors.ERROR)}Error: The requested subnet sizes ({total_needed} addresses) "
-              f"exceed the capacity of the provided network ({network.num_addresses} addresses).{set_color(Colors.NORMAL)}", file=sys.stderr)
+        print(f"{Colors.ERROR}Error: The requested subnet sizes ({total_needed} addresses) "
+              f"exceed the capacity of the provided network ({network.num_addresses} addresses).{Colors.NORMAL}", file=sys.stderr)
         return
 
     current_address = network.network_address
     allocated_subnets = [None] * len(sizes)
     
     for block in needed_blocks:
-        prefix = 32 - int(math.log2(block['block_size']))
+        prefix = 33 - block['block_size'].bit_length()
         subnet = ipaddress.ip_network((current_address, prefix))
         allocated_subnets[block['original_index']] = subnet
         current_address += block['block_size']
@@ -330,7 +545,7 @@ def handle_split_network(network: ipaddress.IPv4Network, sizes: list):
     print(f"Splitting {network} into subnets for hosts: {', '.join(map(str, sizes))}\n")
     for i, subnet in enumerate(allocated_subnets):
         print(f"{i+1}. Requested size: {sizes[i]} hosts (requires block of {subnet.num_addresses})")
-        print_line("Netmask", subnet.netmask, subnet, network)
+        print_line("Netmask", _netmask_int(subnet.prefixlen), subnet, network)
         print_network_info(subnet, network)
 
 def main():
@@ -376,6 +591,7 @@ def main():
     else:
         _COLOR_MODE = 'text'
         Colors.disable()
+    _specialize_printers(_COLOR_MODE, show_binary=not args.nobinary)
 
     # --- Deaggregation / Range Mode ---
     if len(args.params) > 1 and args.params[1] == '-':
@@ -383,17 +599,29 @@ def main():
             start_ip = ipaddress.ip_address(args.params[0])
             end_ip = ipaddress.ip_address(args.params[2])
             print(f"Deaggregating range: {start_ip} - {end_ip}\n")
-            for network in ipaddress.summarize_address_range(start_ip, end_ip):
-                print(network)
+            networks = ipaddress.summarize_address_range(start_ip, end_ip)
+            # Emit in joined chunks: one write per 1024 networks instead of
+            # one line-buffered write each, with bounded memory for ranges
+            # that deaggregate into many thousands of networks.
+            while True:
+                chunk = list(itertools.islice(networks, 1024))
+                if not chunk:
+                    break
+                sys.stdout.write("\n".join(map(str, chunk)))
+                sys.stdout.write("\n")
             sys.exit(0)
         except (ValueError, IndexError) as e:
-            print(f"{set_color(Colors.ERROR)}Invalid range specified. Use: <IP1> - <IP2>. Error: {e}{set_color(Colors.NORMAL)}", file=sys.stderr)
+            print(f"{Colors.ERROR}Invalid range specified. Use: <IP1> - <IP2>. Error: {e}{Colors.NORMAL}", file=sys.stderr)
             sys.exit(1)
 
     # --- Standard Calculation Mode ---
     try:
-        # First, try to parse just the address to detect version
-        test_addr = ipaddress.ip_address(args.params[0].split('/')[0])
+        # First, try to parse just the address to detect version; the fast
+        # dotted-quad path covers the common IPv4 case.
+        addr_str = args.params[0].split('/')[0]
+        test_addr = _fast_v4(addr_str)
+        if test_addr is None:
+            test_addr = ipaddress.ip_address(addr_str)
 
         if isinstance(test_addr, ipaddress.IPv6Address):
             # --- IPv6 Path ---
@@ -407,8 +635,7 @@ def main():
                     network_str += "/64"
             
             initial_network = ipaddress.ip_network(network_str, strict=False)
-            initial_address = ipaddress.ip_address(address_part.split('/')[0])
-            handle_ipv6_calculation(initial_network, initial_address, show_binary=not args.nobinary)
+            handle_ipv6_calculation(initial_network, test_addr, show_binary=not args.nobinary)
             sys.exit(0)
 
         # --- IPv4 Path ---
@@ -431,8 +658,7 @@ def main():
                     netmask2_arg = args.params[2]
             else:
                 # No MASK1, use classful default
-                temp_addr = ipaddress.ip_address(network_str)
-                addr_class = get_class(temp_addr)
+                addr_class = get_class(test_addr)
                 if addr_class == 'A':
                     network_str += '/8'
                 elif addr_class == 'B':
@@ -441,10 +667,10 @@ def main():
                     network_str += '/24'
             
         initial_network = ipaddress.ip_network(network_str, strict=False)
-        initial_address = ipaddress.ip_address(address_part.split('/')[0])
-        
+        initial_address = test_addr
+
     except (ValueError, IndexError) as e:
-        print(f"{set_color(Colors.ERROR)}Invalid address or netmask provided. Error: {e}{set_color(Colors.NORMAL)}", file=sys.stderr)
+        print(f"{Colors.ERROR}Invalid address or netmask provided. Error: {e}{Colors.NORMAL}", file=sys.stderr)
         sys.exit(1)
 
     if args.print_class:
@@ -457,22 +683,25 @@ def main():
         sys.exit(0)
 
     # --- Default/Subnet/Supernet mode ---
-    if _COLOR_MODE == 'html':
+    if _IS_HTML:
         print('<table border="0" cellspacing="0" cellpadding="0">')
     
-    print_line("Address", initial_address, initial_network, show_binary=not args.nobinary)
-    print_line("Netmask", initial_network.netmask, initial_network, show_binary=not args.nobinary)
-    print_line("Wildcard", initial_network.hostmask, initial_network, show_binary=not args.nobinary)
+    print_line("Address", initial_address, initial_network)
+    # Netmask and wildcard as plain ints: one shift/xor instead of two
+    # IPv4Address allocations per network.
+    netmask_int = _netmask_int(initial_network.prefixlen)
+    print_line("Netmask", netmask_int, initial_network)
+    print_line("Wildcard", netmask_int ^ 0xFFFFFFFF, initial_network)
     
-    if _COLOR_MODE == 'html':
+    if _IS_HTML:
         print('<tr><td colspan="3"><hr></td></tr>')
     else:
         print("=>")
 
-    if _COLOR_MODE == 'html':
+    if _IS_HTML:
         print('</table>')
 
-    print_network_info(initial_network, show_binary=not args.nobinary)
+    print_network_info(initial_network)
 
     # Handle second netmask for subnetting/supernetting
     if netmask2_arg:
@@ -483,24 +712,35 @@ def main():
                  
             if new_prefix > initial_network.prefixlen:
                 print(f"--- Subnets for {initial_network} transitioning to /{new_prefix} ---\n")
-                subnets = list(initial_network.subnets(new_prefix=new_prefix))
-                for i, subnet in enumerate(subnets):
-                    if i >= 1000: # Safety break like in original script
-                        print("... stopped at 1000 subnets ...")
-                        break
-                    print(f"{i+1}.")
-                    print_network_info(subnet, initial_network, show_binary=not args.nobinary)
+                # Buffer the (potentially thousands of) print() calls into a
+                # single write instead of one line-buffered write per line.
+                real_stdout = sys.stdout
+                sys.stdout = io.StringIO()
+                try:
+                    # Iterate the subnets generator directly: a /8 -> /24
+                    # expansion has 65536 subnets of which only the first
+                    # 1000 are ever printed.
+                    for i, subnet in enumerate(initial_network.subnets(new_prefix=new_prefix)):
+                        if i >= 1000: # Safety break like in original script
+                            print("... stopped at 1000 subnets ...")
+                            break
+                        print(f"{i+1}.")
+                        print_network_info(subnet, initial_network)
+                finally:
+                    buffered = sys.stdout.getvalue()
+                    sys.stdout = real_stdout
+                    sys.stdout.write(buffered)
             
             elif new_prefix < initial_network.prefixlen:
                 print(f"--- Supernet of {initial_network} transitioning to /{new_prefix} ---\n")
                 supernet = initial_network.supernet(new_prefix=new_prefix)
-                print_network_info(supernet, show_binary=not args.nobinary)
+                print_network_info(supernet)
 
         except ValueError as e:
-            print(f"{set_color(Colors.ERROR)}Invalid second netmask: {e}{set_color(Colors.NORMAL)}", file=sys.stderr)
+            print(f"{Colors.ERROR}Invalid second netmask: {e}{Colors.NORMAL}", file=sys.stderr)
             sys.exit(1)
 
-    if _COLOR_MODE == 'html':
+    if _IS_HTML:
         print("</pre></body></html>")
 
 if __name__ == '__main__':